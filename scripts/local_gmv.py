@@ -16,30 +16,36 @@ Station CSV format (if StationXML not available):
 
 Notes:
 - Supports MiniSEED (.mseed, .msd), SAC (.sac) and SEG-Y (.sgy/.segy) files via ObsPy.
-- Requires ObsPy, matplotlib, numpy, mpl_toolkits.basemap (or cartopy modifications).
+- Requires ObsPy, matplotlib, numpy, cartopy.
 - The script uses a simplified styling derived from the gmv codebase in this repo.
 """
 
 from __future__ import annotations
 
 import argparse
-import glob
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
 import os
+import subprocess
 import sys
+import tempfile
 import datetime as dt
 from typing import Dict, Tuple, List
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib import animation
 from matplotlib import cm
 
 from obspy import UTCDateTime, read, Stream, Inventory, Trace, read_inventory
 
 try:
-    from mpl_toolkits.basemap import Basemap
+    import cartopy.crs as ccrs
+    import cartopy.feature as cfeature
+    HAS_CARTOPY = True
 except Exception:
-    Basemap = None
+    ccrs = None
+    cfeature = None
+    HAS_CARTOPY = False
 
 # Optional SEG-Y support (segyio). If installed, we can extract GroupX/GroupY geometry
 try:
@@ -52,12 +58,28 @@ except Exception:
     BinField = None
     HAS_SEGYIO = False
 
+# Optional Numba support. If installed, the frame-fill kernel is JIT-compiled and
+# parallelized across stations; otherwise a vectorized NumPy path is used.
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except Exception:
+    njit = None
+    prange = range
+    HAS_NUMBA = False
+
+
+WAVEFORM_EXTS = {'.mseed', '.msd', '.sac', '.sgy', '.seg-y', '.segy'}
+
 
 def find_waveforms(data_dir: str) -> List[str]:
-    patterns = ["**/*.mseed", "**/*.msd", "**/*.sac", "**/*.sgy", "**/*.seg-y", "**/*.segy"]
+    # single directory walk with an extension check, instead of six recursive
+    # globs that each re-traverse the tree and fnmatch every entry
     files = list()
-    for p in patterns:
-        files.extend(glob.glob(os.path.join(data_dir, p), recursive=True))
+    for root, _, entries in os.walk(data_dir):
+        for name in entries:
+            if os.path.splitext(name)[1].lower() in WAVEFORM_EXTS:
+                files.append(os.path.join(root, name))
     return sorted(files)
 
 
@@ -101,28 +123,32 @@ def stream_station_key(tr) -> str:
 
 def _pick_segy_scale(gx_vals, gy_vals):
     """Heuristic: test a set of candidate scales and pick one that maps most points into valid lat/lon ranges."""
-    import numpy as _np
     candidates = [1e-3, 1e-4, 1e-5, 1e-6, 1e-7, 1e-8, 1e-9]
     best = None
     best_score = -1
     for sc in candidates:
         lon = gx_vals * sc
         lat = gy_vals * sc
-        ok = _np.logical_and(_np.logical_and(lon > -180, lon < 180), _np.logical_and(lat > -90, lat < 90))
-        score = float(_np.sum(ok)) / len(ok)
+        # count_nonzero on the combined mask; no intermediate logical arrays
+        score = float(np.count_nonzero((lon > -180) & (lon < 180)
+                                       & (lat > -90) & (lat < 90))) / lon.size
+        # stop scanning as soon as a candidate is confidently in range
+        if score >= 0.95:
+            return sc
         if score > best_score:
             best_score = score
             best = sc
     # require at least 95% in-range to be confident
-    if best_score >= 0.95:
-        return best
-    return None
+    return best if best_score >= 0.95 else None
 
 
-def segy_to_stream(path):
+def segy_to_stream(path, keep_segy_headers: bool = False):
     """Convert a SEG-Y file into an ObsPy Stream and a positions dict mapping trace keys to (lat, lon).
 
     Uses segyio; returns (st, positions). If segyio is not available, raises RuntimeError.
+    By default only the trace number is kept in tr.stats.segy; pass
+    keep_segy_headers=True to capture the full ~90-field raw header per trace
+    (costly in memory for multi-thousand-trace files and unused downstream).
     """
     if not HAS_SEGYIO:
         raise RuntimeError('segyio not available')
@@ -139,47 +165,54 @@ def segy_to_stream(path):
             # fallback guess
             sr = 100.0
         n = s.tracecount
-        gx = []
-        gy = []
-        headers = []
-        for i in range(n):
-            hdr = s.header[i]
-            headers.append(hdr)
-            gx.append(hdr.get(TraceField.GroupX, 0))
-            gy.append(hdr.get(TraceField.GroupY, 0))
-        gx = np.array(gx, dtype=float)
-        gy = np.array(gy, dtype=float)
+        # bulk header reads: one C call per field instead of n Python-mediated
+        # header lookups per field
+        gx = np.asarray(s.attributes(TraceField.GroupX)[:], dtype=np.float64)
+        gy = np.asarray(s.attributes(TraceField.GroupY)[:], dtype=np.float64)
+        tsl = np.asarray(s.attributes(TraceField.TRACE_SEQUENCE_LINE)[:], dtype=np.int64)
+        year = np.asarray(s.attributes(TraceField.YearDataRecorded)[:], dtype=np.int64)
+        doy = np.asarray(s.attributes(TraceField.DayOfYear)[:], dtype=np.int64)
+        hour = np.asarray(s.attributes(TraceField.HourOfDay)[:], dtype=np.int64)
+        minute = np.asarray(s.attributes(TraceField.MinuteOfHour)[:], dtype=np.int64)
+        second = np.asarray(s.attributes(TraceField.SecondOfMinute)[:], dtype=np.int64)
         scale = _pick_segy_scale(gx, gy)
         if scale is None:
             # if we couldn't find a good scale, default to 1e-6 (common microdegree encoding)
             scale = 1e-6
-        # Build traces
-        for i in range(n):
-            data = s.trace[i].astype(float)
-            hdr = headers[i]
-            trace_num = int(hdr.get(TraceField.TraceSequenceLine, i + 1)) if TraceField.TraceSequenceLine in hdr else i + 1
-            name = f"SGY.{trace_num:05d}"
-            # estimate starttime from header if available
+        # Estimate start times as one numpy expression: the year -> epoch lookup
+        # runs once per distinct year, then the offsets are pure array math.
+        # Traces with an unusable year fall back to the 1970 epoch as before.
+        year_epoch = np.zeros(n, dtype=np.float64)
+        date_ok = np.ones(n, dtype=bool)
+        for y in np.unique(year):
+            mask = year == y
             try:
-                y = int(hdr.get(TraceField.YearDataRecorded))
-                doy = int(hdr.get(TraceField.DayOfYear))
-                hr = int(hdr.get(TraceField.HourOfDay) or 0)
-                mn = int(hdr.get(TraceField.MinuteOfHour) or 0)
-                sec = int(hdr.get(TraceField.SecondOfMinute) or 0)
-                start = UTCDateTime(y) + (doy - 1) * 86400 + hr * 3600 + mn * 60 + sec
+                # keyword form: a bare int would be read as a POSIX timestamp
+                year_epoch[mask] = UTCDateTime(year=int(y), julday=1).timestamp
             except Exception:
-                start = UTCDateTime(1970, 1, 1)
-            tr = Trace(data=data)
+                date_ok[mask] = False
+        start_ts = year_epoch + (doy - 1) * 86400 + hour * 3600 + minute * 60 + second
+        # Build traces: read all sample data with one bulk call and keep the
+        # native float32 rather than upcasting each trace to float64
+        traces = segyio.tools.collect(s.trace[:]).astype(np.float32, copy=False)
+        for i in range(n):
+            trace_num = int(tsl[i]) if tsl[i] > 0 else i + 1
+            name = f"SGY.{trace_num:05d}"
+            start = UTCDateTime(start_ts[i]) if date_ok[i] else UTCDateTime(1970, 1, 1)
+            tr = Trace(data=traces[i])
             tr.stats.network = 'SGY'
             tr.stats.station = name
             tr.stats.starttime = start
             tr.stats.sampling_rate = sr
-            # attach raw segy header for reference
-            tr.stats.segy = {str(k): hdr.get(k) for k in hdr.keys()}
+            if keep_segy_headers:
+                # attach raw segy header for reference
+                hdr = s.header[i]
+                tr.stats.segy = {str(k): hdr.get(k) for k in hdr.keys()}
+            else:
+                tr.stats.segy = {'trace_num': trace_num}
             st.append(tr)
-            lon = float(hdr.get(TraceField.GroupX, 0)) * scale
-            lat = float(hdr.get(TraceField.GroupY, 0)) * scale
-            positions[f"{tr.stats.network}.{tr.stats.station}"] = (lat, lon)
+            positions[f"{tr.stats.network}.{tr.stats.station}"] = (float(gy[i]) * scale,
+                                                                   float(gx[i]) * scale)
     return st, positions
 
 
@@ -187,12 +220,19 @@ def prepare_meta(st: Stream, positions: Dict[str, Tuple[float, float]],
                  start: UTCDateTime, end: UTCDateTime, time_step: float) -> Tuple[Dict[str, Trace], np.ndarray, Dict]:
     """Prepare trimmed station traces and a times array for streaming frame generation.
 
-    This avoids materializing all frames in memory by keeping per-station traces (trimmed
-    to the requested window and downcast to float32) and returning a times array. The
-    caller can then sample each trace on-the-fly for each frame.
+    Besides the per-station traces (trimmed to the requested window and downcast to
+    float32), this builds structure-of-arrays views of the trace data so frame
+    generation can gather all stations with a couple of vectorized NumPy operations
+    instead of a Python loop over stations:
+        data[n_stations, n_samples_max]  float32, zero-padded per row
+        starttime[n_stations]            POSIX timestamps, float64
+        sr[n_stations]                   sampling rates, float64
+        inv_max[n_stations]              1 / per-station peak amplitude, float32
+        length[n_stations]               valid sample count per row, int64
     """
     station_traces = dict()
     station_max = dict()
+    target_sr = 1.0 / time_step
     for tr in st:
         key = stream_station_key(tr)
         if key not in positions:
@@ -205,87 +245,232 @@ def prepare_meta(st: Stream, positions: Dict[str, Tuple[float, float]],
             continue
         if len(tr2.data) == 0:
             continue
+        # Downsample to the frame rate: at time_step=1s a 100 Hz trace carries
+        # 100x more samples than any frame will ever read. Lanczos interpolation
+        # applies an anti-alias filter before decimating.
+        if tr2.stats.sampling_rate > target_sr * 2:
+            try:
+                tr2.interpolate(sampling_rate=target_sr, method='lanczos', a=20)
+            except Exception:
+                pass
         # downcast to float32 to reduce memory footprint
         tr2.data = tr2.data.astype(np.float32)
         station_traces[key] = tr2
-        station_max[key] = max(1.0, float(np.max(np.abs(tr2.data))))
+        # two linear reductions instead of np.max(np.abs(...)), which would
+        # allocate a temporary the size of the trimmed trace
+        lo, hi = np.min(tr2.data), np.max(tr2.data)
+        station_max[key] = max(1.0, float(max(abs(lo), abs(hi))))
 
     times = np.arange(start.timestamp, end.timestamp, time_step)
-    meta = {'times': times, 'station_keys': list(station_traces.keys()), 'station_max': station_max}
+    keys = list(station_traces.keys())
+    traces = [station_traces[k] for k in keys]
+    lengths = np.array([len(tr.data) for tr in traces], dtype=np.int64)
+    n_samples_max = int(lengths.max()) if len(traces) else 0
+    data = np.zeros((len(traces), n_samples_max), dtype=np.float32)
+    for j, tr in enumerate(traces):
+        data[j, :lengths[j]] = tr.data
+    meta = {'times': times, 'station_keys': keys, 'station_max': station_max,
+            'data': data,
+            'starttime': np.array([tr.stats.starttime.timestamp for tr in traces], dtype=np.float64),
+            'sr': np.array([tr.stats.sampling_rate for tr in traces], dtype=np.float64),
+            'inv_max': np.array([1.0 / station_max[k] for k in keys], dtype=np.float32),
+            'length': lengths}
     return station_traces, times, meta
 
 
-def make_animation(station_traces: Dict[str, Trace], positions: Dict[str, Tuple[float, float]], meta: Dict,
-                   times: np.ndarray, out_file: str, time_step: float, fps: int = 10):
-    # Basic world map centered at data
+def _fill_frames(data, starts, srs, inv_max, lengths, times, frames):
+    # tight numerical kernel; JIT-compiled (parallel across stations) when numba
+    # is available, see below
+    for j in prange(data.shape[0]):
+        t0 = starts[j]
+        sr = srs[j]
+        n = lengths[j]
+        scale = inv_max[j]
+        for i in range(times.shape[0]):
+            idx = int((times[i] - t0) * sr + 0.5)
+            if 0 <= idx < n:
+                frames[i, j] = data[j, idx] * scale
+            else:
+                frames[i, j] = 0.0
+
+
+if HAS_NUMBA:
+    _fill_frames = njit(cache=True, parallel=True, fastmath=True)(_fill_frames)
+
+
+def build_frames(meta: Dict, times: np.ndarray) -> np.ndarray:
+    """Precompute the normalized amplitude of every station at every frame time.
+
+    Returns a float32 matrix frames[n_frames, n_stations]; frame i is then just a
+    row fetch during rendering. Memory cost is n_frames * n_stations * 4 bytes,
+    which is exactly what the est_bytes budget in main() already accounts for.
+    """
+    data = meta['data']
+    n_stations = data.shape[0]
+    frames = np.empty((len(times), n_stations), dtype=np.float32)
+    if HAS_NUMBA:
+        _fill_frames(data, meta['starttime'], meta['sr'], meta['inv_max'],
+                     meta['length'], times, frames)
+        return frames
+    for j in range(n_stations):
+        idx = np.rint((times - meta['starttime'][j]) * meta['sr'][j]).astype(np.int64)
+        valid = (idx >= 0) & (idx < meta['length'][j])
+        idx_c = np.clip(idx, 0, max(int(meta['length'][j]) - 1, 0))
+        frames[:, j] = np.where(valid, data[j, idx_c] * meta['inv_max'][j], 0.0)
+    return frames
+
+
+def _setup_figure(meta: Dict, positions: Dict[str, Tuple[float, float]],
+                  times: np.ndarray, ref_amps):
+    """Build the static figure (map, station scatter, reference trace) once.
+
+    Returns (fig, sc, time_marker, title_text); only those artists change per frame.
+    """
     lats = [positions[k][0] for k in meta['station_keys']]
     lons = [positions[k][1] for k in meta['station_keys']]
 
-    lat0 = np.mean(lats)
-    lon0 = np.mean(lons)
     lat_span = max(lats) - min(lats) if len(lats) > 1 else 10
     lon_span = max(lons) - min(lons) if len(lons) > 1 else 10
 
     fig = plt.figure(figsize=(10, 6))
-    ax_map = fig.add_axes([0.05, 0.25, 0.9, 0.7])
 
-    if Basemap is None:
-        raise RuntimeError('Basemap not available in this Python environment. Install mpl_toolkits.basemap or modify the script to use cartopy.')
+    if not HAS_CARTOPY:
+        raise RuntimeError('cartopy not available in this Python environment. Install cartopy to draw the map.')
 
-    m = Basemap(projection='merc', llcrnrlat=min(lats) - lat_span * 0.1, urcrnrlat=max(lats) + lat_span * 0.1,
-                llcrnrlon=min(lons) - lon_span * 0.1, urcrnrlon=max(lons) + lon_span * 0.1, resolution='i')
-    m.drawcoastlines()
-    m.drawmapboundary(fill_color='lightblue')
-    m.fillcontinents(color='lightgray', lake_color='lightblue')
+    ax_map = fig.add_axes([0.05, 0.25, 0.9, 0.7], projection=ccrs.Mercator())
+    ax_map.set_extent([min(lons) - lon_span * 0.1, max(lons) + lon_span * 0.1,
+                       min(lats) - lat_span * 0.1, max(lats) + lat_span * 0.1],
+                      crs=ccrs.PlateCarree())
+    ax_map.add_feature(cfeature.OCEAN.with_scale('50m'), facecolor='lightblue', zorder=-2)
+    ax_map.add_feature(cfeature.LAND.with_scale('50m'), facecolor='lightgray', zorder=-2)
+    ax_map.add_feature(cfeature.LAKES.with_scale('50m'), facecolor='lightblue', zorder=-2)
+    ax_map.coastlines(resolution='50m', zorder=-1)
 
-    xs, ys = m(lons, lats)
-    sc = ax_map.scatter(xs, ys, c=[0]*len(xs), cmap=cm.seismic, vmin=-1.0, vmax=1.0, s=60, edgecolors='k')
+    sc = ax_map.scatter(lons, lats, c=[0]*len(lons), cmap=cm.seismic, vmin=-1.0, vmax=1.0,
+                        s=60, edgecolors='k', transform=ccrs.PlateCarree())
     # annotate station names
     for i, key in enumerate(meta['station_keys']):
-        ax_map.text(xs[i], ys[i], key.split('.')[-1], fontsize=6, ha='left', va='bottom')
+        ax_map.text(lons[i], lats[i], key.split('.')[-1], fontsize=6, ha='left', va='bottom',
+                    transform=ccrs.PlateCarree())
 
     ax_time = fig.add_axes([0.05, 0.05, 0.9, 0.15])
-    # choose a reference station with data
-    ref_key = meta['station_keys'][0] if meta['station_keys'] else None
-    if ref_key is None:
-        raise RuntimeError('No station traces found inside requested time window')
-
-    # Prepare a simple time-series for reference: collect amplitudes for ref station on-the-fly
-    def sample_tr_at_time(tr, t):
-        idx = int(round((UTCDateTime(t) - tr.stats.starttime) * tr.stats.sampling_rate))
-        if idx < 0 or idx >= len(tr.data):
-            return 0.0
-        return float(tr.data[idx])
-
-    ref_tr = station_traces[ref_key]
-    ref_max = meta['station_max'].get(ref_key, 1.0)
-    ref_amps = [sample_tr_at_time(ref_tr, t) / ref_max for t in times]
     ln_ref, = ax_time.plot(times, ref_amps, color='k', lw=0.7)
 
     time_marker = ax_time.axvline(times[0], color='red')
     ax_time.set_xlim(times[0], times[-1])
     ax_time.set_ylabel('norm amp')
 
-    def update(i):
-        vals = []
-        for key in meta['station_keys']:
-            tr = station_traces[key]
-            maxv = meta['station_max'].get(key, 1.0)
-            v = sample_tr_at_time(tr, times[i]) / maxv
-            vals.append(v)
-        sc.set_array(np.array(vals))
-        time_marker.set_xdata(times[i])
-        fig.suptitle(UTCDateTime(times[i]).strftime('%Y-%m-%d %H:%M:%S UTC'))
-        return sc, time_marker
-
-    ani = animation.FuncAnimation(fig, update, frames=len(times), interval=1000 * time_step, blit=False)
-
-    Writer = animation.writers['ffmpeg']
-    writer = Writer(fps=fps, metadata=dict(artist='local_gmv'))
-    ani.save(out_file, writer=writer)
+    # title as an axes-managed text so updating it does not touch the map axes
+    title_text = ax_map.text(0.5, 1.02, '', transform=ax_map.transAxes,
+                             ha='center', va='bottom')
+    return fig, sc, time_marker, title_text
+
+
+def _encode_frames(fig, sc, time_marker, title_text, frames, frame_times, time_labels,
+                   fps: int, out_file: str, progress: bool = True):
+    """Render the given frames into out_file through a raw-RGBA ffmpeg pipe.
+
+    No per-frame PNG encoding and constant memory (one frame buffer) regardless
+    of movie length. The map, coastlines and reference trace are drawn once and
+    cached as a background bitmap; each frame restores that bitmap and redraws
+    only the three animated artists instead of re-stroking every map path.
+    """
+    n_frames = len(frame_times)
+    canvas = fig.canvas
+    # animated artists are skipped by the full draw, so the cached background
+    # holds only the static layers
+    for artist in (sc, time_marker, title_text):
+        artist.set_animated(True)
+    canvas.draw()
+    bg = canvas.copy_from_bbox(fig.bbox)
+    w, h = canvas.get_width_height()
+    cmd = ['ffmpeg', '-y', '-loglevel', 'error',
+           '-f', 'rawvideo', '-vcodec', 'rawvideo', '-pix_fmt', 'rgba',
+           '-s', f'{w}x{h}', '-r', str(fps), '-i', '-',
+           '-an', '-c:v', 'libx264', '-pix_fmt', 'yuv420p', out_file]
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    try:
+        for i in range(n_frames):
+            sc.set_array(frames[i])
+            time_marker.set_xdata([frame_times[i]])
+            title_text.set_text(time_labels[i])
+            canvas.restore_region(bg)
+            for artist in (sc, time_marker, title_text):
+                artist.axes.draw_artist(artist)
+            canvas.blit(fig.bbox)
+            proc.stdin.write(canvas.buffer_rgba())
+            if progress and ((i + 1) % 100 == 0 or i + 1 == n_frames):
+                print(f'  frame {i + 1}/{n_frames}')
+    finally:
+        proc.stdin.close()
+        rc = proc.wait()
+    if rc != 0:
+        raise RuntimeError(f'ffmpeg exited with code {rc}')
     plt.close(fig)
 
 
+def _render_segment(seg_args):
+    """Worker: rebuild the figure and render one contiguous frame chunk to a segment file."""
+    meta, positions, times, ref_amps, frames, frame_times, time_labels, fps, seg_file = seg_args
+    fig, sc, time_marker, title_text = _setup_figure(meta, positions, times, ref_amps)
+    _encode_frames(fig, sc, time_marker, title_text, frames, frame_times, time_labels,
+                   fps, seg_file, progress=False)
+    return seg_file
+
+
+def make_animation(station_traces: Dict[str, Trace], positions: Dict[str, Tuple[float, float]], meta: Dict,
+                   times: np.ndarray, out_file: str, time_step: float, fps: int = 10, jobs: int = 1):
+    # choose a reference station with data
+    ref_key = meta['station_keys'][0] if meta['station_keys'] else None
+    if ref_key is None:
+        raise RuntimeError('No station traces found inside requested time window')
+
+    # reference time series in one vectorized index instead of a per-frame list comp
+    ref_tr = station_traces[ref_key]
+    ref_max = meta['station_max'].get(ref_key, 1.0)
+    idx = np.rint((times - ref_tr.stats.starttime.timestamp)
+                  * ref_tr.stats.sampling_rate).astype(np.int64)
+    valid = (idx >= 0) & (idx < ref_tr.data.size)
+    idx_c = np.clip(idx, 0, max(ref_tr.data.size - 1, 0))
+    ref_amps = np.where(valid, ref_tr.data[idx_c] / ref_max, 0.0).astype(np.float32)
+
+    frames = build_frames(meta, times)
+    # format all frame titles once, outside the per-frame path
+    time_labels = [UTCDateTime(t).strftime('%Y-%m-%d %H:%M:%S UTC') for t in times]
+
+    jobs = max(1, min(int(jobs), len(times)))
+    if jobs == 1:
+        fig, sc, time_marker, title_text = _setup_figure(meta, positions, times, ref_amps)
+        _encode_frames(fig, sc, time_marker, title_text, frames, times, time_labels, fps, out_file)
+        return
+
+    # Frame rendering is embarrassingly parallel once the frame matrix exists:
+    # each worker renders a disjoint index range to its own MP4 segment, then the
+    # segments are stitched losslessly with ffmpeg's concat demuxer.
+    bounds = np.linspace(0, len(times), jobs + 1).astype(int)
+    with tempfile.TemporaryDirectory(prefix='local_gmv_') as tmp_dir:
+        tasks = []
+        for k in range(jobs):
+            lo, hi = int(bounds[k]), int(bounds[k + 1])
+            if lo == hi:
+                continue
+            seg_file = os.path.join(tmp_dir, f'seg_{k:03d}.mp4')
+            tasks.append((meta, positions, times, ref_amps,
+                          frames[lo:hi], times[lo:hi], time_labels[lo:hi], fps, seg_file))
+        # spawn (not fork) so each worker gets a clean matplotlib state
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(processes=len(tasks)) as pool:
+            seg_files = pool.map(_render_segment, tasks)
+        list_file = os.path.join(tmp_dir, 'segments.txt')
+        with open(list_file, 'w') as fp:
+            for seg in seg_files:
+                fp.write(f"file '{seg}'\n")
+        rc = subprocess.call(['ffmpeg', '-y', '-loglevel', 'error', '-f', 'concat',
+                              '-safe', '0', '-i', list_file, '-c', 'copy', out_file])
+        if rc != 0:
+            raise RuntimeError(f'ffmpeg concat exited with code {rc}')
+
+
 def main():
     p = argparse.ArgumentParser(description='Create a GMV-style animation from local seismic files')
     p.add_argument('--data-dir', required=True, help='Top-level data directory to search for waveform files')
@@ -296,9 +481,13 @@ def main():
     p.add_argument('--time-step', type=float, default=1.0, help='Seconds between frames (default: 1s)')
     p.add_argument('--out', required=True, help='Output mp4 file')
     p.add_argument('--fps', type=int, default=10, help='Output frames per second for the movie')
+    p.add_argument('--jobs', type=int, default=1,
+                   help='Number of parallel worker processes for frame rendering (default: 1)')
     p.add_argument('--max-frames', type=int, default=10000, help='Maximum frames allowed to generate (default: 10000)')
     p.add_argument('--max-mem-mb', type=int, default=4096, help='Maximum estimated memory in MiB for frames (default: 4096)')
     p.add_argument('--dry-run', action='store_true', help='Estimate frames/memory and exit without creating frames or animation')
+    p.add_argument('--keep-segy-headers', action='store_true',
+                   help='Keep the full raw SEG-Y trace headers in tr.stats.segy (memory heavy)')
     args = p.parse_args()
 
     files = find_waveforms(args.data_dir)
@@ -310,23 +499,60 @@ def main():
     # Station positions (may be populated by SEG-Y geometry detection below)
     positions = dict()
 
-    st = Stream()
+    # Collect traces into a plain list and build the Stream once at the end;
+    # repeated `st += ...` re-links the trace list per file, which goes
+    # quadratic over thousands of files.
+    all_traces = []
+    segy_files = []
+    other_files = []
     for fn in files:
         # If SEG-Y and segyio is available, convert traces and extract geometry from headers
         if fn.lower().endswith(('.sgy', '.segy')) and HAS_SEGYIO:
-            try:
-                s2, pos2 = segy_to_stream(fn)
-                st += s2
-                # merge positions but do not overwrite if user provided station CSV/XML later
-                positions.update(pos2)
-                continue
-            except Exception as e:
-                print('Warning: could not process SEG-Y', fn, e)
-                # fall back to trying to read with ObsPy
+            segy_files.append(fn)
+        else:
+            other_files.append(fn)
+
+    # SEG-Y stays serial: segyio is not thread-safe
+    for fn in segy_files:
         try:
-            st += read(fn)
+            s2, pos2 = segy_to_stream(fn, keep_segy_headers=args.keep_segy_headers)
+            all_traces.extend(s2.traces)
+            # merge positions but do not overwrite if user provided station CSV/XML later
+            positions.update(pos2)
+        except Exception as e:
+            print('Warning: could not process SEG-Y', fn, e)
+            # fall back to trying to read with ObsPy
+            other_files.append(fn)
+
+    # With an explicit window we can pre-scan headers only and skip files (and
+    # samples) that never intersect [start, end] instead of reading everything
+    # and trimming later.
+    win_start = UTCDateTime(args.start) if args.start else None
+    win_end = UTCDateTime(args.end) if args.end else None
+
+    def _read_one(fn):
+        try:
+            if win_start is not None and win_end is not None:
+                scan = read(fn, headonly=True)
+                if not any(tr.stats.starttime <= win_end and tr.stats.endtime >= win_start
+                           for tr in scan):
+                    return None
+                return read(fn, starttime=win_start, endtime=win_end)
+            return read(fn)
         except Exception as e:
             print('Warning: could not read', fn, e)
+            return None
+
+    if other_files:
+        # ObsPy's read releases the GIL during decompression, so a thread pool
+        # overlaps file I/O instead of paying the sum of per-file latencies
+        read_workers = args.jobs if args.jobs > 1 else 8
+        with ThreadPoolExecutor(max_workers=read_workers) as ex:
+            for s2 in ex.map(_read_one, other_files):
+                if s2 is not None:
+                    all_traces.extend(s2.traces)
+
+    st = Stream(traces=all_traces)
 
     # If user provided station XML or CSV, merge those with any positions discovered in SEG-Y
     if args.station_xml and os.path.exists(args.station_xml):
@@ -351,14 +577,8 @@ def main():
         sys.exit(1)
 
     # Start/end times
-    if args.start:
-        start = UTCDateTime(args.start)
-    else:
-        start = UTCDateTime(min([tr.stats.starttime for tr in st]))
-    if args.end:
-        end = UTCDateTime(args.end)
-    else:
-        end = UTCDateTime(max([tr.stats.endtime for tr in st]))
+    start = win_start if win_start is not None else UTCDateTime(min([tr.stats.starttime for tr in st]))
+    end = win_end if win_end is not None else UTCDateTime(max([tr.stats.endtime for tr in st]))
 
     # Safety checks: estimate number of frames and estimated memory usage to avoid runaway runs
     duration = end.timestamp - start.timestamp
@@ -403,7 +623,8 @@ def main():
     n_frames = len(times)
     print(f'Creating animation with {n_frames} frames, saving to {args.out}')
     try:
-        make_animation(station_traces, positions, meta, times, args.out, args.time_step, fps=args.fps)
+        make_animation(station_traces, positions, meta, times, args.out, args.time_step,
+                       fps=args.fps, jobs=args.jobs)
     except MemoryError:
         print('MemoryError while creating animation; try reducing frame count, limiting stations, or increasing --time-step')
         sys.exit(1)
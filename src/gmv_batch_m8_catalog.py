@@ -13,7 +13,7 @@ Description:
     Channels included: Broadband (LH*, BH*, HH*) and non-broadband (EH*, SH*) stations
 
 Usage:
-    python gmv_batch_m8_catalog.py
+    python gmv_batch_m8_catalog.py [--report-only] [--jobs N]
 
 Requirements:
     - requests library for HTTP requests
@@ -30,9 +30,14 @@ History:
 
 import sys
 import os
+import argparse
+import gzip
 import json
+import hashlib
+import operator
 import subprocess
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 from datetime import datetime
@@ -46,6 +51,12 @@ except ImportError:
     print("[ERR] Could not import gmv_utils. Make sure gmv_utils.py is in the same directory.")
     sys.exit(1)
 
+try:
+    import gmv_param as param
+except ImportError:
+    print("[ERR] Could not import gmv_param. Make sure gmv_param.py is in the same directory.")
+    sys.exit(1)
+
 
 def get_usgs_earthquakes(min_magnitude=8.0, start_year=2010):
     """
@@ -77,10 +88,30 @@ def get_usgs_earthquakes(min_magnitude=8.0, start_year=2010):
     print(f"[INFO] URL: {url}\n")
     
     try:
-        req = Request(url)
-        response = urlopen(req)
-        data = json.loads(response.read().decode('utf-8'))
-        response.close()
+        # ask for a gzip payload; the GeoJSON body compresses ~10x
+        req = Request(url, headers={'Accept-Encoding': 'gzip',
+                                    'User-Agent': 'gmv-batch/1.0'})
+        # timeout so a stalled endpoint cannot hang the batch; server errors
+        # and network failures are retried with exponential backoff, which is
+        # far cheaper than restarting the whole batch
+        payload = None
+        for attempt in range(3):
+            try:
+                response = urlopen(req, timeout=30)
+                payload = response.read()
+                if response.info().get('Content-Encoding') == 'gzip':
+                    payload = gzip.decompress(payload)
+                response.close()
+                break
+            except (HTTPError, URLError, TimeoutError) as er:
+                if isinstance(er, HTTPError) and er.code < 500:
+                    raise
+                if attempt == 2:
+                    raise
+                wait_s = 2 ** attempt
+                print(f"[WARN] USGS request failed ({er}); retrying in {wait_s} s")
+                time.sleep(wait_s)
+        data = json.loads(payload.decode('utf-8'))
         
         earthquakes = []
         features = data.get('features', [])
@@ -105,8 +136,9 @@ def get_usgs_earthquakes(min_magnitude=8.0, start_year=2010):
             if eq_info['magnitude'] is not None and eq_info['latitude'] is not None:
                 earthquakes.append(eq_info)
         
-        # Sort by time (ascending)
-        earthquakes.sort(key=lambda x: x['time'])
+        # Sort by time (ascending); itemgetter runs the key extraction in C
+        # instead of one lambda frame per comparison key
+        earthquakes.sort(key=operator.itemgetter('time'))
         
         return earthquakes
     
@@ -199,6 +231,18 @@ def run_gmv_script(earthquake, gmv_script_path):
             '-o', output_filename
         ]
         
+        # Skip events already rendered by a previous run with the identical
+        # command line; the marker hash changes whenever any parameter does,
+        # so tweaked re-runs still re-render.
+        cmd_hash = hashlib.sha1(repr(cmd).encode()).hexdigest()[:12]
+        done_marker = os.path.join('.cache', f"{output_filename}.{cmd_hash}.done")
+        # the video lands in param.video_dir with ':' stripped from the
+        # basename, matching gmv_generalized.py's animation_file_name
+        video_path = os.path.join(param.video_dir, f"{output_filename}.mp4".replace(':', ''))
+        if os.path.exists(done_marker) and os.path.exists(video_path):
+            print(f"[INFO] {output_filename}.mp4 already generated with identical parameters, skipping")
+            return True
+
         print(f"\n{'='*80}")
         print(f"[INFO] Processing Earthquake")
         print(f"{'='*80}")
@@ -216,6 +260,8 @@ def run_gmv_script(earthquake, gmv_script_path):
         result = subprocess.run(cmd, capture_output=False, text=True)
         
         if result.returncode == 0:
+            if utils.mkdir('.cache') is not None:
+                open(done_marker, 'w').close()
             print(f"\n[INFO] Successfully generated GMV for {human_time} M{mag_formatted} earthquake")
             return True
         else:
@@ -229,7 +275,14 @@ def run_gmv_script(earthquake, gmv_script_path):
 
 def main():
     """Main execution function."""
-    
+
+    parser = argparse.ArgumentParser(description='Generate GMV animations for USGS M7.5+ earthquakes')
+    parser.add_argument('--report-only', action='store_true',
+                        help='List the earthquakes that would be processed without running GMV')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of GMV renders to run concurrently (default: 1)')
+    args = parser.parse_args()
+
     print(f"\n{'*'*80}")
     print(f"  USGS M8+ Earthquake Catalog - GMV Batch Processing")
     print(f"{'*'*80}\n")
@@ -252,48 +305,58 @@ def main():
         print("[WARN] No earthquakes found matching criteria.")
         sys.exit(0)
     
-    # Check for command line argument for report-only mode
-    report_only = '--report-only' in sys.argv or '-r' in sys.argv
-    
-    if report_only:
+    if args.report_only:
         print(f"\n[INFO] REPORT MODE - Showing what will be generated (no actual processing)\n")
     else:
         print(f"\n[INFO] Starting GMV generation for {len(earthquakes)} earthquake(s)...\n")
-    
+
     # Process each earthquake
     successful = 0
     failed = 0
-    
-    for idx, eq in enumerate(earthquakes, 1):
-        try:
+
+    if args.report_only:
+        for idx, eq in enumerate(earthquakes, 1):
             human_time, iso_time, date_str = format_time(eq['time'])
             place = eq['place']
             place_parts = place.split(', ')
             region = place_parts[-1] if len(place_parts) > 1 else place
             mag_str = f"{eq['magnitude']:.1f}".replace('.', '_')
             output_filename = f"{date_str}_M{mag_str}_{region.replace(' ', '')}"
-            
-            if report_only:
-                print(f"{idx:2d}. {human_time} | M{eq['magnitude']:.1f} | "
-                      f"Lat {eq['latitude']:7.2f}, Lon {eq['longitude']:8.2f} | "
-                      f"{region} | Output: {output_filename}.mp4")
-                successful += 1
-            else:
+            print(f"{idx:2d}. {human_time} | M{eq['magnitude']:.1f} | "
+                  f"Lat {eq['latitude']:7.2f}, Lon {eq['longitude']:8.2f} | "
+                  f"{region} | Output: {output_filename}.mp4")
+            successful += 1
+    elif args.jobs <= 1:
+        for idx, eq in enumerate(earthquakes, 1):
+            try:
                 if run_gmv_script(eq, gmv_script):
                     successful += 1
                 else:
                     failed += 1
-        except KeyboardInterrupt:
-            print(f"\n[INFO] Processing interrupted by user at earthquake #{idx}")
-            break
-        except Exception as er:
-            print(f"[ERR] Unexpected error processing earthquake #{idx}: {er}")
-            failed += 1
-        
-        # Add a small delay between runs to avoid overwhelming resources (skip in report mode)
-        if not report_only and idx < len(earthquakes):
-            print(f"[INFO] Waiting 5 seconds before next earthquake...\n")
-            time.sleep(5)
+            except KeyboardInterrupt:
+                print(f"\n[INFO] Processing interrupted by user at earthquake #{idx}")
+                break
+            except Exception as er:
+                print(f"[ERR] Unexpected error processing earthquake #{idx}: {er}")
+                failed += 1
+    else:
+        # Each GMV invocation is an independent subprocess, so dispatch them
+        # across worker processes and tally results as they complete.
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(earthquakes))) as executor:
+            futures = {executor.submit(run_gmv_script, eq, gmv_script): eq for eq in earthquakes}
+            try:
+                for future in as_completed(futures):
+                    try:
+                        if future.result():
+                            successful += 1
+                        else:
+                            failed += 1
+                    except Exception as er:
+                        print(f"[ERR] Unexpected error processing earthquake: {er}")
+                        failed += 1
+            except KeyboardInterrupt:
+                print(f"\n[INFO] Processing interrupted by user")
+                executor.shutdown(wait=False, cancel_futures=True)
     
     # Print summary
     print(f"\n{'='*80}")
@@ -14,12 +14,13 @@ Description:
     Channels included: Broadband (LH*, BH*, HH*) and non-broadband (EH*, SH*) stations
 
 Usage:
-    python gmv_batch_ok_local.py [--report-only]
+    python gmv_batch_ok_local.py [--report-only] [--jobs N] [--force] [--prefetch]
+                                 [--min-magnitude M] [--start-year YYYY]
 
 Requirements:
     - requests library for HTTP requests
     - ObsPy for earthquake data handling
-    - gmv_generalized.py script in the same directory
+    - gmv_generalized.py and usgs_client.py in the same directory
     - Internet access to query USGS API
 
 Author:
@@ -31,12 +32,18 @@ History:
 
 import sys
 import os
+import argparse
 import json
+import logging
+import multiprocessing
 import subprocess
-import time
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
-from datetime import datetime
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+import numpy as np
+import requests
 
 # Add the parent directory to the path to import gmv utilities
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -47,12 +54,48 @@ except ImportError:
     print("[ERR] Could not import gmv_utils. Make sure gmv_utils.py is in the same directory.")
     sys.exit(1)
 
+try:
+    import gmv_param as param
+except ImportError:
+    print("[ERR] Could not import gmv_param. Make sure gmv_param.py is in the same directory.")
+    sys.exit(1)
+
+
+try:
+    from usgs_client import fetch_usgs_events, build_usgs_url, OK_BBOX, _EQ_DTYPE
+except ImportError:
+    print("[ERR] Could not import usgs_client. Make sure usgs_client.py is in the same directory.")
+    sys.exit(1)
+
+# ObsPy is optional here: it is only used to prefetch the next event's
+# waveform window while the current render runs.
+try:
+    from obspy import UTCDateTime
+    from obspy.clients.fdsn import Client as FDSNClient
+    HAS_OBSPY = True
+except Exception:
+    HAS_OBSPY = False
+
 
-# Oklahoma region boundaries
-OK_MIN_LAT = 33.6
-OK_MAX_LAT = 37.0
-OK_MIN_LON = -103.0
-OK_MAX_LON = -94.4
+log = logging.getLogger('gmv_batch_ok_local')
+
+
+def _setup_logging(log_queue=None):
+    """Configure logging for the calling process.
+
+    In the main process (log_queue=None) records go straight to stdout; in
+    worker processes they are funneled through a queue to the parent's
+    QueueListener, so concurrent renders always emit whole lines instead of
+    interleaved fragments.
+    """
+    if log_queue is None:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+    else:
+        handler = QueueHandler(log_queue)
+    log.handlers[:] = [handler]
+    log.setLevel(logging.INFO)
+    log.propagate = False
 
 
 def get_oklahoma_earthquakes(min_magnitude=4.5, start_year=2010):
@@ -68,70 +111,29 @@ def get_oklahoma_earthquakes(min_magnitude=4.5, start_year=2010):
     
     Returns:
     --------
-    list : List of earthquake dictionaries with relevant information
+    numpy.ndarray : structured array (_EQ_DTYPE) of events sorted by time
     """
     
     start_date = f"{start_year}-01-01"
     end_date = datetime.now().strftime("%Y-%m-%d")
-    
-    # USGS GeoJSON API endpoint for earthquake data within Oklahoma bounds
-    url = (f"https://earthquake.usgs.gov/fdsnws/event/1/query?"
-           f"format=geojson"
-           f"&starttime={start_date}"
-           f"&endtime={end_date}"
-           f"&minmagnitude={min_magnitude}"
-           f"&minlatitude={OK_MIN_LAT}"
-           f"&maxlatitude={OK_MAX_LAT}"
-           f"&minlongitude={OK_MIN_LON}"
-           f"&maxlongitude={OK_MAX_LON}")
-    
-    print(f"\n[INFO] Querying USGS Earthquake Catalog for Oklahoma Events...")
-    print(f"[INFO] Region: Lat [{OK_MIN_LAT}, {OK_MAX_LAT}], Lon [{OK_MIN_LON}, {OK_MAX_LON}]")
-    print(f"[INFO] URL: {url}\n")
-    
+
+    log.info(f"\n[INFO] Querying USGS Earthquake Catalog for Oklahoma Events...")
+    log.info(f"[INFO] Region: Lat [{OK_BBOX.min_lat}, {OK_BBOX.max_lat}], "
+          f"Lon [{OK_BBOX.min_lon}, {OK_BBOX.max_lon}]")
+    log.info(f"[INFO] URL: {build_usgs_url(OK_BBOX, min_magnitude, start_date, end_date)}\n")
+
     try:
-        req = Request(url)
-        response = urlopen(req)
-        data = json.loads(response.read().decode('utf-8'))
-        response.close()
-        
-        earthquakes = []
-        features = data.get('features', [])
-        
-        print(f"[INFO] Found {len(features)} earthquakes with magnitude >= {min_magnitude} in Oklahoma since {start_year}")
-        
-        for feature in features:
-            props = feature.get('properties', {})
-            coords = feature.get('geometry', {}).get('coordinates', [])
-            
-            eq_info = {
-                'time': props.get('time'),  # milliseconds since epoch
-                'latitude': coords[1] if len(coords) > 1 else None,
-                'longitude': coords[0] if len(coords) > 0 else None,
-                'depth': coords[2] if len(coords) > 2 else 0,
-                'magnitude': props.get('mag'),
-                'place': props.get('place', 'Unknown'),
-                'usgs_id': props.get('code'),
-                'url': props.get('url')
-            }
-            
-            if eq_info['magnitude'] is not None and eq_info['latitude'] is not None:
-                earthquakes.append(eq_info)
-        
-        # Sort by time (ascending)
-        earthquakes.sort(key=lambda x: x['time'])
-        
+        earthquakes = fetch_usgs_events(bbox=OK_BBOX, min_mag=min_magnitude,
+                                        start=start_date, end=end_date)
+        log.info(f"[INFO] Found {len(earthquakes)} earthquakes with magnitude >= {min_magnitude} in Oklahoma since {start_year}")
         return earthquakes
-    
-    except HTTPError as er:
-        print(f"[ERR] HTTP Error: {er}")
-        return []
-    except URLError as er:
-        print(f"[ERR] URL Error: {er}")
-        return []
+
+    except requests.RequestException as er:
+        log.error(f"[ERR] HTTP Error: {er}")
+        return np.empty(0, dtype=_EQ_DTYPE)
     except Exception as er:
-        print(f"[ERR] Error querying USGS API: {er}")
-        return []
+        log.error(f"[ERR] Error querying USGS API: {er}")
+        return np.empty(0, dtype=_EQ_DTYPE)
 
 
 def format_time(timestamp_ms):
@@ -147,111 +149,271 @@ def format_time(timestamp_ms):
     --------
     tuple : (human_readable_date, iso_format_time, date_string_for_filename)
     """
-    timestamp_s = timestamp_ms / 1000.0
-    dt = datetime.utcfromtimestamp(timestamp_s)
-    
-    human_readable = dt.strftime("%Y-%m-%d %H:%M:%S UTC")
-    iso_format = dt.strftime("%Y-%m-%dT%H:%M:%S")
-    filename_date = dt.strftime("%Y%m%d")
-    
+    # tz-aware replacement for the deprecated utcfromtimestamp; f-strings on the
+    # datetime attributes avoid strftime re-parsing its format string per call
+    dt = datetime.fromtimestamp(timestamp_ms / 1000.0, tz=timezone.utc)
+    y, mo, d, h, mi, s = dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second
+
+    human_readable = f"{y:04d}-{mo:02d}-{d:02d} {h:02d}:{mi:02d}:{s:02d} UTC"
+    iso_format = f"{y:04d}-{mo:02d}-{d:02d}T{h:02d}:{mi:02d}:{s:02d}"
+    filename_date = f"{y:04d}{mo:02d}{d:02d}"
+
     return human_readable, iso_format, filename_date
 
 
-def run_gmv_script(earthquake, gmv_script_path):
+# Networks and channel bands requested for every event; shared between the
+# GMV command line and the waveform prefetcher.
+_GMV_NETWORKS = 'OK,US,N4,XO,O2,Y7,Y9,ZP,TA,IU'
+_GMV_BANDS = 'LH,BH,HH,EH,SH'
+
+# Constant tail of every gmv_generalized.py invocation; only the per-event
+# flags (-e/-z/-m/-t/-o) vary between calls.
+_GMV_BASE_ARGS = (
+    '-r', 'ok_local',  # Use zoomed Oklahoma region
+    '-n', _GMV_NETWORKS,  # Oklahoma and other available networks
+    '-b', _GMV_BANDS,  # Include broadband and non-broadband channels
+    '-d', '600',   # Animation duration: 600 seconds (10 minutes) instead of default 2400
+    '-p', '-10',   # Animation delay: start 10 seconds before event (instead of -20)
+    '-S', 'SMO',   # Use SMO station in OKC as reference if available
+    '-N', 'OK',    # Network containing SMO
+    '-P', '10',    # Phase spacing: 10 seconds between labels for tight zoom
+    '-f', '0.05',  # local override: bandpass low freq (Hz) - slightly extended from default
+    '-F', '2.0',   # local override: bandpass high freq (Hz) - more signal than default for better visualization
+)
+
+
+# Journal of per-event outcomes so an interrupted batch resumes where it left
+# off instead of re-rendering hours of finished animations.
+_JOURNAL_PATH = os.path.join(os.path.expanduser('~'), '.gmv', 'ok_batch_journal.json')
+_JOURNAL_LOCK = threading.Lock()
+
+
+def _load_journal():
+    """Return the journal dict (usgs_id -> outcome), or {} if absent/corrupt."""
+    try:
+        with open(_JOURNAL_PATH) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _journal_record(usgs_id, status):
+    """Record an event outcome in the journal with an atomic rewrite.
+
+    The read-modify-write is serialized within this process; concurrent
+    worker processes can still race each other, but a lost entry only costs
+    a redundant skip check on the next run, never a wrong skip.
+    """
+    with _JOURNAL_LOCK:
+        journal = _load_journal()
+        journal[str(usgs_id)] = {'status': status,
+                                 'updated': datetime.now(timezone.utc).isoformat()}
+        os.makedirs(os.path.dirname(_JOURNAL_PATH), exist_ok=True)
+        tmp_file = _JOURNAL_PATH + '.tmp'
+        with open(tmp_file, 'w') as fp:
+            json.dump(journal, fp, indent=2)
+        os.replace(tmp_file, _JOURNAL_PATH)
+
+
+def _output_name(earthquake, time_fmt):
+    """Output video basename for an event: YYYYMMDD_OKlocal_MagnitudeM_m."""
+    date_str = time_fmt[2]
+    mag_str = f"{earthquake['mag']:.1f}".replace('.', '_')
+    return f"{date_str}_OKlocal_Magnitude{mag_str}"
+
+
+def _video_path(output_filename):
+    """Absolute path where gmv_generalized.py writes an event's video.
+
+    Mirrors the child's own construction: param.video_dir plus the basename
+    with any ':' stripped (see animation_file_name in gmv_generalized.py).
+    """
+    return os.path.join(param.video_dir, f"{output_filename}.mp4".replace(':', ''))
+
+
+def _prefetch(earthquake):
+    """Best-effort warm-up download of the next event's waveform window.
+
+    gmv_generalized.py streams its data from the federated data centers and
+    keeps no local waveform cache, so this cannot hand data to the child
+    process directly; issuing the same window request ahead of time warms
+    the data-center caches so the child's download phase - which would
+    otherwise serialize with the previous event's render - is shorter. Any
+    failure is swallowed: prefetching is purely opportunistic.
+
+    Because the child re-downloads the identical window, this doubles the
+    waveform traffic per event, so it only runs when --prefetch is given.
+    """
+    if not HAS_OBSPY:
+        return
+    if _load_journal().get(str(earthquake['usgs_id']), {}).get('status') == 'done':
+        return
+    try:
+        t0 = UTCDateTime(int(earthquake['time']) / 1000.0)
+        # same window the GMV run requests: 10 s before origin, 600 s duration
+        bulk = [(net, '*', '*', f"{band}?", t0 - 10, t0 + 600)
+                for net in _GMV_NETWORKS.split(',')
+                for band in _GMV_BANDS.split(',')]
+        FDSNClient('IRIS').get_waveforms_bulk(bulk)
+    except Exception:
+        pass
+
+
+def _pump(stream, prefix):
+    """Copy subprocess output line by line, prefixed with an event tag.
+
+    Keeps interleaved logs from concurrent GMV runs attributable, and drops
+    the known-noisy ObsPy UserWarning lines.
+    """
+    for line in stream:
+        if 'UserWarning' in line:
+            continue
+        log.info('%s%s', prefix, line.rstrip('\n'))
+
+
+def run_gmv_script(earthquake, gmv_script_path, time_fmt, output_filename, force=False):
     """
     Run the gmv_generalized.py script for a given Oklahoma earthquake.
     Uses only Oklahoma seismic networks and stations for phase picking.
-    
+
     Parameters:
     -----------
-    earthquake : dict
-        Dictionary containing earthquake information
+    earthquake : numpy record (_EQ_DTYPE)
+        Structured record containing earthquake information
     gmv_script_path : str
         Path to the gmv_generalized.py script
-    
+    time_fmt : tuple
+        (human_time, iso_time, date_str) as produced by format_time, computed
+        once by the caller instead of per call
+    output_filename : str
+        Output video basename as produced by _output_name, also precomputed
+        by the caller
+    force : bool
+        Re-render even if the journal marks this event done
+
     Returns:
     --------
     bool : True if successful, False otherwise
     """
-    
+
     try:
         # Extract earthquake data
-        lat = earthquake['latitude']
-        lon = earthquake['longitude']
-        mag = earthquake['magnitude']
+        lat = earthquake['lat']
+        lon = earthquake['lon']
+        mag = earthquake['mag']
         depth = earthquake['depth']
         place = earthquake['place']
-        
-        human_time, iso_time, date_str = format_time(earthquake['time'])
-        
-        # Create output filename with "OKlocal" identifier
+        usgs_id = str(earthquake['usgs_id'])
+
+        human_time, iso_time, date_str = time_fmt
         mag_str = f"{mag:.1f}".replace('.', '_')
-        output_filename = f"{date_str}_OKlocal_Magnitude{mag_str}"
-        
+
+        # Skip events already rendered. The journal is authoritative, but a
+        # non-empty video from a run that predates the journal counts too; a
+        # journal entry marking a failure always forces the re-render.
+        if not force:
+            entry = _load_journal().get(usgs_id)
+            try:
+                have_mp4 = os.stat(_video_path(output_filename)).st_size > 0
+            except OSError:
+                have_mp4 = False
+            if have_mp4 and (entry is None or entry.get('status') == 'done'):
+                if entry is None:
+                    _journal_record(usgs_id, 'done')
+                log.info(f"[INFO] Skipping {human_time} M{mag:.1f}: {output_filename}.mp4 "
+                      f"already generated (use --force to re-render)")
+                return True
+            if not have_mp4 and entry is not None and entry.get('status') == 'done':
+                log.info(f"[INFO] {output_filename}.mp4 missing despite journal 'done'; re-rendering")
+
         # Format magnitude for title
         mag_formatted = f"{mag:.1f}"
         
-        # Create the command to run gmv_generalized.py
-        # Use Oklahoma networks: OK, US, N4, XO, O2, Y7, Y9, ZP and other available networks
-        # Include broadband (LH*, BH*, HH*) and non-broadband (EH*, SH*) stations
+        # Create the command: per-event flags up front, constant tail hoisted
+        # to _GMV_BASE_ARGS. %g keeps float flags free of repr noise like
+        # 12.300000000000001 that the child would otherwise re-parse.
         cmd = [
             sys.executable,
             gmv_script_path,
             '-e', f"{lat},{lon}",
-            '-z', str(depth),
-            '-m', str(mag),
+            '-z', f"{depth:g}",
+            '-m', f"{mag:g}",
             '-t', iso_time,
-            '-r', 'ok_local',  # Use zoomed Oklahoma region
-            '-n', 'OK,US,N4,XO,O2,Y7,Y9,ZP,TA,IU',  # Oklahoma and other available networks
-            '-b', 'LH,BH,HH,EH,SH',  # Include broadband and non-broadband channels
-            '-d', '600',  # Animation duration: 600 seconds (10 minutes) instead of default 2400
-            '-p', '-10',  # Animation delay: start 10 seconds before event (instead of -20)
-            '-S', 'SMO',  # Use SMO station in OKC as reference if available
-            '-N', 'OK',   # Network containing SMO
-            '-P', '10',   # Phase spacing: 10 seconds between labels for tight zoom
-            '-f', '0.05', # local override: bandpass low freq (Hz) - slightly extended from default
-            '-F', '2.0',  # local override: bandpass high freq (Hz) - more signal than default for better visualization
-            '-o', output_filename
+            '-o', output_filename,
+            *_GMV_BASE_ARGS
         ]
         
-        print(f"\n{'='*80}")
-        print(f"[INFO] Processing Local Oklahoma Earthquake")
-        print(f"{'='*80}")
-        print(f"[INFO] Date/Time:    {human_time}")
-        print(f"[INFO] Location:     {place}")
-        print(f"[INFO] Coordinates:  Lat {lat:.4f}, Lon {lon:.4f}")
-        print(f"[INFO] Depth:        {depth:.1f} km")
-        print(f"[INFO] Magnitude:    {mag_formatted}")
-        print(f"[INFO] Networks:     OK, US, N4, XO, O2, Y7, Y9, ZP, TA, IU")
-        print(f"[INFO] Channels:     LH*, BH*, HH*, EH*, SH* (broadband + non-broadband)")
-        print(f"[INFO] Map View:     Oklahoma (zoomed)")
-        print(f"[INFO] Duration:     600 seconds (10 minutes)")
-        print(f"[INFO] Ref Station:  SMO (OKC)")
-        print(f"[INFO] Output File:  {output_filename}.mp4")
-        print(f"[INFO] Running GMV Script...")
-        print(f"{'-'*80}\n")
+        log.info(f"\n{'='*80}")
+        log.info(f"[INFO] Processing Local Oklahoma Earthquake")
+        log.info(f"{'='*80}")
+        log.info(f"[INFO] Date/Time:    {human_time}")
+        log.info(f"[INFO] Location:     {place}")
+        log.info(f"[INFO] Coordinates:  Lat {lat:.4f}, Lon {lon:.4f}")
+        log.info(f"[INFO] Depth:        {depth:.1f} km")
+        log.info(f"[INFO] Magnitude:    {mag_formatted}")
+        log.info(f"[INFO] Networks:     OK, US, N4, XO, O2, Y7, Y9, ZP, TA, IU")
+        log.info(f"[INFO] Channels:     LH*, BH*, HH*, EH*, SH* (broadband + non-broadband)")
+        log.info(f"[INFO] Map View:     Oklahoma (zoomed)")
+        log.info(f"[INFO] Duration:     600 seconds (10 minutes)")
+        log.info(f"[INFO] Ref Station:  SMO (OKC)")
+        log.info(f"[INFO] Output File:  {output_filename}.mp4")
+        log.info(f"[INFO] Running GMV Script...")
+        log.info(f"{'-'*80}\n")
         
-        # Run the gmv script
-        result = subprocess.run(cmd, capture_output=False, text=True)
-        
-        if result.returncode == 0:
-            print(f"\n[INFO] Successfully generated local GMV for {human_time} M{mag_formatted} earthquake")
+        # Run the gmv script, relaying its output through a reader thread
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                bufsize=1, text=True)
+        pump = threading.Thread(target=_pump, args=(proc.stdout, f"[{date_str}-M{mag_str}] "),
+                                daemon=True)
+        pump.start()
+        returncode = proc.wait()
+        pump.join(timeout=5)
+
+        if returncode == 0:
+            _journal_record(usgs_id, 'done')
+            log.info(f"\n[INFO] Successfully generated local GMV for {human_time} M{mag_formatted} earthquake")
             return True
         else:
-            print(f"\n[ERR] GMV script failed with return code {result.returncode}")
+            _journal_record(usgs_id, 'failed')
+            log.error(f"\n[ERR] GMV script failed with return code {returncode}")
             return False
     
     except Exception as er:
-        print(f"[ERR] Error running GMV script: {er}")
+        log.error(f"[ERR] Error running GMV script: {er}")
         return False
 
 
+def _worker(task):
+    """Top-level (picklable) wrapper so tasks can be dispatched to worker processes."""
+    eq, gmv_script, time_fmt, out_name, force = task
+    return run_gmv_script(eq, gmv_script, time_fmt, out_name, force=force)
+
+
 def main():
     """Main execution function."""
-    
-    print(f"\n{'*'*80}")
-    print(f"  Oklahoma Local Earthquake Catalog - GMV Batch Processing")
-    print(f"{'*'*80}\n")
+
+    parser = argparse.ArgumentParser(description='Generate GMVs for M4.5+ Oklahoma earthquakes')
+    parser.add_argument('--report-only', action='store_true',
+                        help='List the earthquakes that would be processed without running GMV')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='Number of GMV renders to run concurrently '
+                             '(default: one per CPU, capped at the event count)')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render events the journal already marks done')
+    parser.add_argument('--prefetch', action='store_true',
+                        help='With --jobs 1, prefetch the next event\'s waveform window '
+                             'during the current render (downloads each window twice)')
+    parser.add_argument('--min-magnitude', type=float, default=4.5,
+                        help='Minimum magnitude to retrieve (default: 4.5)')
+    parser.add_argument('--start-year', type=int, default=2010,
+                        help='Starting year for the earthquake query (default: 2010)')
+    args = parser.parse_args()
+
+    _setup_logging()
+
+    log.info(f"\n{'*'*80}")
+    log.info(f"  Oklahoma Local Earthquake Catalog - GMV Batch Processing")
+    log.info(f"{'*'*80}\n")
     
     # Get the path to the gmv_generalized.py script
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -259,66 +421,112 @@ def main():
     
     # Verify the gmv script exists
     if not os.path.isfile(gmv_script):
-        print(f"[ERR] gmv_generalized.py not found at {gmv_script}")
+        log.error(f"[ERR] gmv_generalized.py not found at {gmv_script}")
         sys.exit(1)
     
-    print(f"[INFO] GMV script location: {gmv_script}\n")
+    log.info(f"[INFO] GMV script location: {gmv_script}\n")
     
-    # Query USGS for M4.5+ earthquakes in Oklahoma since 2010
-    earthquakes = get_oklahoma_earthquakes(min_magnitude=4.5, start_year=2010)
+    # Query USGS for matching earthquakes in Oklahoma
+    earthquakes = get_oklahoma_earthquakes(min_magnitude=args.min_magnitude,
+                                           start_year=args.start_year)
     
-    if not earthquakes:
-        print("[WARN] No earthquakes found matching criteria.")
+    if len(earthquakes) == 0:
+        log.warning("[WARN] No earthquakes found matching criteria.")
         sys.exit(0)
     
-    # Check for command line argument for report-only mode
-    report_only = '--report-only' in sys.argv or '-r' in sys.argv
-    
-    if report_only:
-        print(f"\n[INFO] REPORT MODE - Showing what will be generated (no actual processing)\n")
+    if args.report_only:
+        log.info(f"\n[INFO] REPORT MODE - Showing what will be generated (no actual processing)\n")
     else:
-        print(f"\n[INFO] Starting GMV generation for {len(earthquakes)} earthquake(s)...\n")
-    
+        log.info(f"\n[INFO] Starting GMV generation for {len(earthquakes)} earthquake(s)...\n")
+
     # Process each earthquake
     successful = 0
     failed = 0
-    
-    for idx, eq in enumerate(earthquakes, 1):
-        try:
-            human_time, iso_time, date_str = format_time(eq['time'])
-            mag_str = f"{eq['magnitude']:.1f}".replace('.', '_')
-            output_filename = f"{date_str}_OKlocal_Magnitude{mag_str}"
-            
-            if report_only:
-                print(f"{idx:3d}. {human_time} | M{eq['magnitude']:.1f} | "
-                      f"Lat {eq['latitude']:7.2f}, Lon {eq['longitude']:8.2f} | "
-                      f"Depth {eq['depth']:6.1f}km | {output_filename}.mp4")
-                successful += 1
+
+    # One formatting pass shared by the report and run paths; _EQ_DTYPE
+    # records cannot carry extra fields, so the per-event time tuples and
+    # output names ride alongside the array.
+    time_fmts = [format_time(int(eq['time'])) for eq in earthquakes]
+    out_names = [_output_name(eq, time_fmt)
+                 for eq, time_fmt in zip(earthquakes, time_fmts)]
+
+    if args.report_only:
+        for idx, (eq, time_fmt, out_name) in enumerate(zip(earthquakes, time_fmts, out_names), 1):
+            human_time, iso_time, date_str = time_fmt
+            log.info(f"{idx:3d}. {human_time} | M{eq['mag']:.1f} | "
+                  f"Lat {eq['lat']:7.2f}, Lon {eq['lon']:8.2f} | "
+                  f"Depth {eq['depth']:6.1f}km | {out_name}.mp4")
+            successful += 1
+    elif args.jobs == 1:
+        # Opt-in pipeline overlap: while event N renders (CPU-bound), a single
+        # background worker prefetches event N+1's waveform window
+        # (network-bound), so consecutive download and render phases run
+        # concurrently instead of back to back.
+        prefetcher = None
+        if args.prefetch:
+            if HAS_OBSPY:
+                prefetcher = ThreadPoolExecutor(max_workers=1)
             else:
-                if run_gmv_script(eq, gmv_script):
+                log.warning("[WARN] --prefetch requested but ObsPy is not available; ignoring")
+        for idx, (eq, time_fmt, out_name) in enumerate(zip(earthquakes, time_fmts, out_names), 1):
+            if prefetcher is not None and idx < len(earthquakes):
+                prefetcher.submit(_prefetch, earthquakes[idx])
+            try:
+                if run_gmv_script(eq, gmv_script, time_fmt, out_name, force=args.force):
                     successful += 1
                 else:
                     failed += 1
-        except KeyboardInterrupt:
-            print(f"\n[INFO] Processing interrupted by user at earthquake #{idx}")
-            break
-        except Exception as er:
-            print(f"[ERR] Unexpected error processing earthquake #{idx}: {er}")
-            failed += 1
-        
-        # Add a small delay between runs to avoid overwhelming resources (skip in report mode)
-        if not report_only and idx < len(earthquakes):
-            print(f"[INFO] Waiting 5 seconds before next earthquake...\n")
-            time.sleep(5)
+            except KeyboardInterrupt:
+                log.info(f"\n[INFO] Processing interrupted by user at earthquake #{idx}")
+                break
+            except Exception as er:
+                log.error(f"[ERR] Unexpected error processing earthquake #{idx}: {er}")
+                failed += 1
+        if prefetcher is not None:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
+    else:
+        # Each GMV run is an independent subprocess, so dispatch them across
+        # worker processes; --jobs caps concurrency to avoid flooding the
+        # FDSN/IRIS data centers.
+        max_workers = min(args.jobs or os.cpu_count() or 1, len(earthquakes))
+        tasks = [(eq, gmv_script, time_fmt, out_name, args.force)
+                 for eq, time_fmt, out_name in zip(earthquakes, time_fmts, out_names)]
+        # Worker records travel through a managed queue (picklable across
+        # spawned processes) to this process's listener, which replays them on
+        # the console handler one record at a time.
+        with multiprocessing.Manager() as manager:
+            log_queue = manager.Queue(-1)
+            listener = QueueListener(log_queue, *log.handlers)
+            listener.start()
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers,
+                                         initializer=_setup_logging,
+                                         initargs=(log_queue,)) as executor:
+                    futures = {executor.submit(_worker, task): task for task in tasks}
+                    try:
+                        for future in as_completed(futures):
+                            try:
+                                if future.result():
+                                    successful += 1
+                                else:
+                                    failed += 1
+                            except Exception as er:
+                                log.error(f"[ERR] Unexpected error processing earthquake: {er}")
+                                failed += 1
+                    except KeyboardInterrupt:
+                        log.info(f"\n[INFO] Processing interrupted by user")
+                        executor.shutdown(wait=False, cancel_futures=True)
+            finally:
+                listener.stop()
     
     # Print summary
-    print(f"\n{'='*80}")
-    print(f"  BATCH PROCESSING SUMMARY")
-    print(f"{'='*80}")
-    print(f"Total earthquakes processed: {len(earthquakes)}")
-    print(f"Successful:                 {successful}")
-    print(f"Failed:                     {failed}")
-    print(f"{'='*80}\n")
+    log.info(f"\n{'='*80}")
+    log.info(f"  BATCH PROCESSING SUMMARY")
+    log.info(f"{'='*80}")
+    log.info(f"Total earthquakes processed: {len(earthquakes)}")
+    log.info(f"Successful:                 {successful}")
+    log.info(f"Failed:                     {failed}")
+    log.info(f"{'='*80}\n")
 
 
 if __name__ == '__main__':
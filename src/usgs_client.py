@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""
+Name:
+    usgs_client.py
+
+Description:
+    Shared client for the USGS Earthquake Hazards Program FDSN event service.
+    Centralizes the query-URL construction, the pooled requests session, the
+    on-disk response cache and the structured-array catalog conversion so the
+    batch scripts and test utilities all go through a single code path.
+
+Requirements:
+    - requests library for HTTP requests
+    - numpy for the structured catalog array
+    - ijson (optional) for streaming GeoJSON parsing of large catalogs
+
+History:
+    2026-08-30: Initial creation, extracted from gmv_batch_ok_local.py
+"""
+
+import os
+import hashlib
+import json
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# Optional streaming JSON parser: events are consumed one at a time instead of
+# materializing the full GeoJSON object tree for multi-MB catalogs.
+try:
+    import ijson
+    HAS_IJSON = True
+except Exception:
+    ijson = None
+    HAS_IJSON = False
+
+BBOX = namedtuple('BBOX', 'min_lat max_lat min_lon max_lon')
+
+# Oklahoma region boundaries
+OK_BBOX = BBOX(33.6, 37.0, -103.0, -94.4)
+
+# Packed record layout for the catalog. A structured array is a fraction of
+# the memory of a list of per-event dicts and sorts with a single C call,
+# which matters once a caller points this at denser catalogs than OK M4.5+.
+_EQ_DTYPE = np.dtype([('time', 'i8'),  # milliseconds since epoch
+                      ('lat', 'f4'),
+                      ('lon', 'f4'),
+                      ('depth', 'f4'),
+                      ('mag', 'f4'),
+                      ('place', 'U64'),
+                      ('usgs_id', 'U16')])
+
+# USGS responses are cached on disk for this many seconds (override with the
+# GMV_USGS_TTL environment variable); the same multi-year query is otherwise
+# re-issued on every run.
+_USGS_CACHE_TTL = int(os.environ.get('GMV_USGS_TTL', 86400))
+_USGS_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'gmv')
+
+# One session for all USGS calls: keep-alive avoids a fresh TLS handshake per
+# request and the adapter retries transient failures with backoff.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'gmv-batch/1.0'})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                                       max_retries=Retry(total=3, backoff_factor=0.5,
+                                                         status_forcelist=[500, 502, 503, 504])))
+
+
+class _RateLimiter:
+    """Minimum-interval gate on outbound requests, shared across threads.
+
+    The USGS service throttles aggressive clients; pacing our own requests
+    is cheaper than eating 429s and retry backoff. Each caller reserves the
+    next send slot under the lock, then sleeps outside it, so concurrent
+    window fetches queue up at min_interval spacing instead of bursting.
+    """
+
+    def __init__(self, min_interval=0.2):
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_ok = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self._min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+_RATE_LIMITER = _RateLimiter()
+
+
+def build_usgs_url(bbox, min_mag, start_date, end_date):
+    """Build the USGS GeoJSON query URL for a bounding box and magnitude floor."""
+    return (f"https://earthquake.usgs.gov/fdsnws/event/1/query?"
+            f"format=geojson"
+            f"&starttime={start_date}"
+            f"&endtime={end_date}"
+            f"&minmagnitude={min_mag}"
+            f"&minlatitude={bbox.min_lat}"
+            f"&maxlatitude={bbox.max_lat}"
+            f"&minlongitude={bbox.min_lon}"
+            f"&maxlongitude={bbox.max_lon}")
+
+
+def _cached_fetch_path(url, ttl_s=None):
+    """Return the path of the cached response body for a URL, refetching if stale.
+
+    A cache file younger than ttl_s is reused without touching the network;
+    otherwise the response is streamed to disk in chunks (the body never has
+    to fit in memory here) and the cache file is replaced atomically.
+    """
+    if ttl_s is None:
+        ttl_s = _USGS_CACHE_TTL
+    key = hashlib.sha1(url.encode()).hexdigest()
+    cache_file = os.path.join(_USGS_CACHE_DIR, f"usgs_{key}.json")
+    try:
+        if time.time() - os.path.getmtime(cache_file) < ttl_s:
+            return cache_file
+    except OSError:
+        pass
+    _RATE_LIMITER.wait()
+    r = _SESSION.get(url, timeout=30, stream=True)
+    r.raise_for_status()
+    os.makedirs(_USGS_CACHE_DIR, exist_ok=True)
+    # atomic replace so a concurrent reader never sees a partial file
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'wb') as fp:
+        for chunk in r.iter_content(chunk_size=1 << 16):
+            fp.write(chunk)
+    os.replace(tmp_file, cache_file)
+    return cache_file
+
+
+def _iter_features(path):
+    """Yield GeoJSON features from a response file one at a time.
+
+    With ijson installed the file is parsed incrementally, so peak memory per
+    window stays flat no matter how many events a catalog holds; without it
+    this falls back to json.load on the whole file.
+    """
+    if HAS_IJSON:
+        with open(path, 'rb') as fp:
+            yield from ijson.items(fp, 'features.item')
+    else:
+        with open(path) as fp:
+            yield from json.load(fp).get('features', [])
+
+
+def _features_to_array(features):
+    """Convert an iterable of USGS GeoJSON features into a time-sorted _EQ_DTYPE array."""
+    rows = []
+    for feature in features:
+        props = feature.get('properties', {})
+        coords = feature.get('geometry', {}).get('coordinates', [])
+
+        mag = props.get('mag')
+        lat = coords[1] if len(coords) > 1 else None
+        lon = coords[0] if len(coords) > 0 else None
+        # drop events without a magnitude or location as they stream past
+        if mag is None or lat is None or lon is None:
+            continue
+        rows.append((int(props.get('time') or 0),  # milliseconds since epoch
+                     float(lat),
+                     float(lon),
+                     float(coords[2]) if len(coords) > 2 else 0.0,
+                     float(mag),
+                     props.get('place', 'Unknown'),
+                     props.get('code') or ''))
+
+    earthquakes = np.array(rows, dtype=_EQ_DTYPE)
+    earthquakes.sort(order='time')
+    return earthquakes
+
+
+def fetch_usgs_events(bbox=OK_BBOX, min_mag=4.5, start='2010-01-01', end=None):
+    """Fetch the event catalog for a region as a time-sorted structured array.
+
+    Parameters:
+    -----------
+    bbox : BBOX
+        Bounding box to query (default: Oklahoma)
+    min_mag : float
+        Minimum magnitude to retrieve
+    start : str
+        Query start date (YYYY-MM-DD)
+    end : str or None
+        Query end date (YYYY-MM-DD); defaults to today
+
+    Returns:
+    --------
+    numpy.ndarray : structured array (_EQ_DTYPE) of events sorted by time
+
+    The query is split into one-year windows fetched concurrently: the FDSN
+    event service caps a single response at 20 000 events, so one multi-year
+    query silently bounds how low min_mag can usefully go. The windows are
+    I/O-bound and share the pooled session, so threads are sufficient.
+    """
+    if end is None:
+        end = datetime.now().strftime("%Y-%m-%d")
+
+    start_year = int(start[:4])
+    end_year = int(end[:4])
+    windows = []
+    for year in range(start_year, end_year + 1):
+        window_start = start if year == start_year else f"{year}-01-01"
+        window_end = end if year == end_year else f"{year + 1}-01-01"
+        windows.append((window_start, window_end))
+
+    def _fetch_one_window(window):
+        window_start, window_end = window
+        path = _cached_fetch_path(build_usgs_url(bbox, min_mag, window_start, window_end))
+        return _features_to_array(_iter_features(path))
+
+    if len(windows) == 1:
+        return _fetch_one_window(windows[0])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(_fetch_one_window, windows))
+
+    events = np.concatenate(results)
+    # each window is already time-sorted, so a stable mergesort degenerates
+    # into an O(n) merge of the runs (and preserves window order for the
+    # duplicate drop below)
+    events.sort(order='time', kind='mergesort')
+    # USGS treats both endtime and starttime as inclusive, so an event falling
+    # exactly on a year boundary shows up in two windows; drop the duplicate.
+    # Only events that actually carry a USGS code take part: missing codes are
+    # stored as '' and must not collapse into one another.
+    if len(events):
+        has_id = events['usgs_id'] != ''
+        _, unique_idx = np.unique(events['usgs_id'][has_id], return_index=True)
+        keep = ~has_id
+        keep[np.flatnonzero(has_id)[unique_idx]] = True
+        events = events[keep]
+    return events